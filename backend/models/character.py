@@ -1,6 +1,11 @@
+from array import array
 from datetime import datetime
 from typing import Dict, List, Optional
 
+STAT_IDX = {'STR': 0, 'DEX': 1, 'INT': 2, 'WIS': 3, 'CON': 4, 'CHA': 5}
+STAT_MIN = 0
+STAT_MAX = 255
+
 class Character:
     """RPG Character Model"""
     
@@ -8,35 +13,55 @@ class Character:
         self.name = name
         self.class_type = class_type
         self.level = level
-        self.stats = {
-            'STR': 10,
-            'DEX': 10,
-            'INT': 10,
-            'WIS': 10,
-            'CON': 10,
-            'CHA': 10
-        }
+        # One unsigned byte per stat, ordered by STAT_IDX; use get_stat/set_stat
+        self._stats = array('B', [10] * len(STAT_IDX))
         self.skills = []
         self.equipment = {}
         self.appearance = {}
         self.created_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self._updated_at = datetime.utcnow()
+        self._dirty = False
+    
+    @property
+    def updated_at(self) -> datetime:
+        """Last modification time, refreshed lazily via touch()"""
+        self.touch()
+        return self._updated_at
+    
+    @updated_at.setter
+    def updated_at(self, value: datetime):
+        self._updated_at = value
+        self._dirty = False
+    
+    def touch(self):
+        """Refresh updated_at once if the character changed since the last touch"""
+        if self._dirty:
+            self._updated_at = datetime.utcnow()
+            self._dirty = False
     
     def set_stat(self, stat_name: str, value: int):
-        """Set character stat value"""
-        if stat_name in self.stats:
-            self.stats[stat_name] = value
-            self.updated_at = datetime.utcnow()
+        """Set character stat value (an integer from 0 to 255)"""
+        i = STAT_IDX.get(stat_name)
+        if i is not None:
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise ValueError(f"Stat {stat_name} must be an integer, got {value!r}")
+            if not STAT_MIN <= value <= STAT_MAX:
+                raise ValueError(
+                    f"Stat {stat_name} must be between {STAT_MIN} and {STAT_MAX}, got {value}"
+                )
+            self._stats[i] = value
+            self._dirty = True
     
     def get_stat(self, stat_name: str) -> int:
         """Get character stat value"""
-        return self.stats.get(stat_name, 0)
+        i = STAT_IDX.get(stat_name)
+        return self._stats[i] if i is not None else 0
     
     def learn_skill(self, skill_id: str):
         """Add skill to character"""
         if skill_id not in self.skills:
             self.skills.append(skill_id)
-            self.updated_at = datetime.utcnow()
+            self._dirty = True
     
     def can_use_skill(self, skill_id: str) -> bool:
         """Check if character has learned skill"""
@@ -44,11 +69,12 @@ class Character:
     
     def to_dict(self) -> Dict:
         """Export character to dictionary"""
+        self.touch()
         return {
             'name': self.name,
             'class': self.class_type,
             'level': self.level,
-            'stats': self.stats,
+            'stats': dict(zip(STAT_IDX, self._stats)),
             'skills': self.skills,
             'equipment': self.equipment,
             'appearance': self.appearance,
@@ -1,4 +1,6 @@
 import pytest
+from datetime import datetime, timedelta
+from backend.models import character as character_module
 from backend.models.character import Character
 
 def test_character_creation():
@@ -34,3 +36,91 @@ def test_character_skill_learning():
     
     assert "fireball" in char.skills
     assert char.can_use_skill("fireball")
+
+def _freeze_utcnow(monkeypatch, moment):
+    """Make Character see `moment` as the current UTC time"""
+    class FrozenDatetime(datetime):
+        @classmethod
+        def utcnow(cls):
+            return moment
+    monkeypatch.setattr(character_module, "datetime", FrozenDatetime)
+
+def test_character_touch_on_export(monkeypatch):
+    """Test updated_at is refreshed once per batch of changes"""
+    char = Character(
+        name="Test Rogue",
+        class_type="rogue"
+    )
+    created = char.updated_at
+    first = created + timedelta(minutes=1)
+    second = created + timedelta(minutes=2)
+    
+    _freeze_utcnow(monkeypatch, first)
+    char.set_stat("DEX", 15)
+    char.learn_skill("backstab")
+    data = char.to_dict()
+    assert data['updated_at'] == first.isoformat()
+    assert char.updated_at == first
+    
+    _freeze_utcnow(monkeypatch, second)
+    assert char.to_dict()['updated_at'] == first.isoformat()
+    assert char.updated_at == first
+
+def test_character_updated_at_refreshes_on_read(monkeypatch):
+    """Test reading updated_at reflects pending changes"""
+    char = Character(
+        name="Test Ranger",
+        class_type="ranger"
+    )
+    later = char.updated_at + timedelta(minutes=1)
+    
+    _freeze_utcnow(monkeypatch, later)
+    char.set_stat("DEX", 14)
+    assert char.updated_at == later
+
+def test_character_stats_export():
+    """Test stats are exported as a name -> value mapping"""
+    char = Character(
+        name="Test Cleric",
+        class_type="cleric"
+    )
+    char.set_stat("WIS", 17)
+    char.set_stat("LUCK", 5)
+    
+    stats = char.to_dict()['stats']
+    assert stats == {'STR': 10, 'DEX': 10, 'INT': 10, 'WIS': 17, 'CON': 10, 'CHA': 10}
+    assert char.get_stat("LUCK") == 0
+
+@pytest.mark.parametrize("value", [256, -1])
+def test_character_stat_out_of_range(value):
+    """Test out-of-range stat values are rejected"""
+    char = Character(
+        name="Test Warrior",
+        class_type="warrior"
+    )
+    with pytest.raises(ValueError, match="between 0 and 255"):
+        char.set_stat("STR", value)
+    assert char.get_stat("STR") == 10
+
+@pytest.mark.parametrize("value", [15.0, "15", True])
+def test_character_stat_non_integer(value):
+    """Test non-integer stat values are rejected"""
+    char = Character(
+        name="Test Warrior",
+        class_type="warrior"
+    )
+    with pytest.raises(ValueError, match="must be an integer"):
+        char.set_stat("STR", value)
+    assert char.get_stat("STR") == 10
+
+def test_character_stat_bounds():
+    """Test the stat range endpoints are accepted"""
+    char = Character(
+        name="Test Warrior",
+        class_type="warrior"
+    )
+    char.set_stat("STR", 0)
+    char.set_stat("CON", 255)
+    
+    assert char.get_stat("STR") == 0
+    assert char.get_stat("CON") == 255